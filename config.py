@@ -20,10 +20,14 @@ COLLECTIBLE_TYPES = [
 ]
 
 # Performance Configuration
-MAX_WORKERS = 10  # Number of concurrent download threads
+MAX_WORKERS = 10  # Concurrency level; in-flight downloads = MAX_WORKERS * 5
 REQUEST_TIMEOUT = 30  # Request timeout in seconds
 MAX_RETRIES = 3  # Maximum retry attempts for failed requests
 
 # Image Processing Configuration
 TARGET_WIDTH = 256  # Target image width in pixels
 TARGET_HEIGHT = 192  # Target image height in pixels
+PNG_COMPRESS_LEVEL = 1  # zlib level 0-9; higher is smaller but slower
+
+# Logging Configuration
+LOG_LEVEL = "INFO"  # Minimum level written to the console
@@ -9,14 +9,18 @@ with concurrent processing, advanced error handling, and structured logging.
 import sys
 from pathlib import Path
 
+from loguru import logger
+
 from config import (COLLECTIBLE_TYPES, COLLECTIBLES_URL, DUMP_FOLDER,
-                    MAX_RETRIES, MAX_WORKERS, OUTPUT_FOLDER, REQUEST_TIMEOUT,
-                    TARGET_HEIGHT, TARGET_WIDTH)
+                    LOG_LEVEL, MAX_RETRIES, MAX_WORKERS, OUTPUT_FOLDER,
+                    PNG_COMPRESS_LEVEL, REQUEST_TIMEOUT, TARGET_HEIGHT,
+                    TARGET_WIDTH)
 
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.core.parser import CSMedalParser  # noqa: E402
+from src.services.collectible_service import WORKER_START_METHOD  # noqa: E402
 
 
 def main() -> int:
@@ -25,6 +29,17 @@ def main() -> int:
     Returns:
         Exit code: 0 for success, 1 for failure
     """
+    # Queue log records so workers never block on the console sink; the
+    # queue is created in the image workers' context so they can share it
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=LOG_LEVEL,
+        enqueue=True,
+        context=WORKER_START_METHOD,
+    )
+
+    parser = None
     try:
         # Initialize the parser with configuration
         parser = CSMedalParser(
@@ -37,6 +52,8 @@ def main() -> int:
             max_retries=MAX_RETRIES,
             target_width=TARGET_WIDTH,
             target_height=TARGET_HEIGHT,
+            png_compress_level=PNG_COMPRESS_LEVEL,
+            forward_worker_logs=True,
         )
 
         # Run the parser
@@ -50,6 +67,9 @@ def main() -> int:
     except Exception as e:
         print(f"Unexpected error: {e}")
         return 1
+    finally:
+        if parser is not None:
+            parser.close()
 
 
 if __name__ == "__main__":
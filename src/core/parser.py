@@ -1,6 +1,8 @@
 """Main CS Medal Parser application class"""
 
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -28,6 +30,8 @@ class CSMedalParser:
         max_retries: int = 3,
         target_width: int = 256,
         target_height: int = 192,
+        png_compress_level: int = 1,
+        forward_worker_logs: bool = False,
     ):
         """Initialize CS Medal Parser
 
@@ -41,6 +45,9 @@ class CSMedalParser:
             max_retries: Maximum retry attempts
             target_width: Target image width
             target_height: Target image height
+            png_compress_level: zlib compression level for saved PNGs
+            forward_worker_logs: Send image worker log records to the
+                configured loguru sinks (see CollectibleService)
         """
         self.api_url = api_url
         self.output_folder = Path(output_folder)
@@ -51,20 +58,29 @@ class CSMedalParser:
 
         # Initialize services
         self.network_client = NetworkClient(
-            timeout=request_timeout, max_retries=max_retries
+            timeout=request_timeout,
+            max_retries=max_retries,
+            pool_size=max(max_workers, 32),
         )
         self.image_processor = ImageProcessor(
             target_width=target_width,
             target_height=target_height,
             network_client=self.network_client,
+            compress_level=png_compress_level,
         )
 
         self.api_service = ApiService(
-            base_url=api_url, timeout=request_timeout, max_retries=max_retries
+            base_url=api_url,
+            timeout=request_timeout,
+            max_retries=max_retries,
+            cache_folder=self.dump_folder,
+            network_client=self.network_client,
         )
 
         self.collectible_service = CollectibleService(
-            image_processor=self.image_processor, max_workers=max_workers
+            image_processor=self.image_processor,
+            max_workers=max_workers,
+            forward_worker_logs=forward_worker_logs,
         )
 
     def run(self) -> bool:
@@ -75,6 +91,9 @@ class CSMedalParser:
         """
         start_time = time.time()
         logger.info("Starting CS:GO Medal Parser")
+        logger.info(
+            f"Image backend: {self.image_processor.get_pillow_build()}"
+        )
 
         try:
             # Step 1: Fetch collectibles from API
@@ -83,17 +102,21 @@ class CSMedalParser:
                 logger.error("No collectibles fetched from API")
                 return False
 
-            # Step 2: Dump raw data
-            self._dump_collectibles(collectibles)
+            # Step 2: Dump raw data in the background while images are
+            # filtered and processed
+            with ThreadPoolExecutor(max_workers=1) as dump_executor:
+                dump_executor.submit(self._dump_collectibles, collectibles)
 
-            # Step 3: Filter collectibles
-            filtered_batch = self._filter_collectibles(collectibles)
-            if not filtered_batch.items:
-                logger.warning("No collectibles matched the filter criteria")
-                return False
+                # Step 3: Filter collectibles
+                filtered_batch = self._filter_collectibles(collectibles)
+                if not filtered_batch.items:
+                    logger.warning(
+                        "No collectibles matched the filter criteria"
+                    )
+                    return False
 
-            # Step 4: Process images
-            results = self._process_images(filtered_batch.items)
+                # Step 4: Process images
+                results = self._process_images(filtered_batch.items)
 
             # Step 5: Log final results
             self._log_final_results(results, start_time)
@@ -104,6 +127,10 @@ class CSMedalParser:
             logger.error(f"Fatal error in main execution: {e}")
             return False
 
+    def close(self) -> None:
+        """Release network connections held by the parser"""
+        self.network_client.close()
+
     def _fetch_collectibles(self) -> Optional[List[Collectible]]:
         """Fetch collectibles from API
 
@@ -111,7 +138,7 @@ class CSMedalParser:
             List of collectibles or None if failed
         """
         try:
-            return self.api_service.fetch_collectibles_sync()
+            return self.api_service.fetch_collectibles()
         except Exception as e:
             logger.error(f"Failed to fetch collectibles: {e}")
             return None
@@ -203,21 +230,34 @@ class CSMedalParser:
         Returns:
             Dictionary with current statistics
         """
-        output_images = (
-            list(self.output_folder.glob("*.png"))
-            if self.output_folder.exists()
-            else []
-        )
-        dump_files = (
-            list(self.dump_folder.glob("*.json"))
-            if self.dump_folder.exists()
-            else []
-        )
-
         return {
-            "output_images_count": len(output_images),
-            "dump_files_count": len(dump_files),
+            "output_images_count": self._count_files(
+                self.output_folder, ".png"
+            ),
+            "dump_files_count": self._count_files(self.dump_folder, ".json"),
             "output_folder": str(self.output_folder),
             "dump_folder": str(self.dump_folder),
             "filter_types": self.filter_config.types,
         }
+
+    @staticmethod
+    def _count_files(folder: Path, suffix: str) -> int:
+        """Count the non-hidden files with a suffix in a folder
+
+        Args:
+            folder: Directory to scan
+            suffix: File name suffix to match
+
+        Returns:
+            Number of matching files, or 0 if the folder does not exist
+        """
+        try:
+            with os.scandir(folder) as entries:
+                return sum(
+                    1
+                    for entry in entries
+                    if entry.name.endswith(suffix)
+                    and not entry.name.startswith(".")
+                )
+        except FileNotFoundError:
+            return 0
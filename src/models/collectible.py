@@ -1,8 +1,9 @@
 """Pydantic models for CS:GO collectibles"""
 
-from typing import List, Optional
+import re
+from typing import FrozenSet, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, Field, HttpUrl, PrivateAttr, field_validator
 
 
 class Collectible(BaseModel):
@@ -20,6 +21,11 @@ class Collectible(BaseModel):
         default=None, description="URL to the collectible image"
     )
 
+    @property
+    def image_id(self) -> str:
+        """ID without the ``collectible-`` prefix, used for image names"""
+        return self.id.removeprefix("collectible-")
+
     @field_validator("id")
     @classmethod
     def validate_id(cls, v):
@@ -39,7 +45,6 @@ class Collectible(BaseModel):
     class Config:
         """Pydantic configuration"""
 
-        validate_assignment = True
         use_enum_values = True
 
 
@@ -62,6 +67,14 @@ class CollectibleFilter(BaseModel):
     require_image: bool = Field(
         default=True, description="Only include items with image URLs"
     )
+    # Caches keyed on the types they were built from, so copies and
+    # reassigned types never see a stale value
+    _pattern: Optional[Tuple[Tuple[str, ...], re.Pattern]] = PrivateAttr(
+        default=None
+    )
+    _type_set: Optional[Tuple[Tuple[str, ...], FrozenSet[str]]] = (
+        PrivateAttr(default=None)
+    )
 
     @field_validator("types")
     @classmethod
@@ -71,6 +84,31 @@ class CollectibleFilter(BaseModel):
             raise ValueError("Filter types cannot be empty")
         return [t.lower().strip() for t in v if t.strip()]
 
+    def get_pattern(self) -> re.Pattern:
+        """Get the case-insensitive pattern matching any filter type
+
+        Compiled on first use and cached until the types change.
+        """
+        key = tuple(self.types)
+        if self._pattern is None or self._pattern[0] != key:
+            terms = "|".join(re.escape(term) for term in key)
+            self._pattern = (
+                key,
+                re.compile(rf"\b(?:{terms})\b", re.IGNORECASE),
+            )
+        return self._pattern[1]
+
+    def get_type_set(self) -> FrozenSet[str]:
+        """Get the filter types as a set for exact type matches
+
+        Types are already lowercased and stripped by validate_types. The
+        set is cached until the types change.
+        """
+        key = tuple(self.types)
+        if self._type_set is None or self._type_set[0] != key:
+            self._type_set = (key, frozenset(key))
+        return self._type_set[1]
+
 
 class ProcessingResult(BaseModel):
     """Result of image processing operation"""
@@ -85,11 +123,6 @@ class ProcessingResult(BaseModel):
         default=None, description="Path to the saved image file"
     )
 
-    class Config:
-        """Pydantic configuration"""
-
-        validate_assignment = True
-
 
 class CollectibleBatch(BaseModel):
     """Batch of collectibles for processing"""
@@ -1,36 +1,58 @@
 """API service for fetching collectibles data"""
 
-import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
+import orjson
+import requests
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from ..models.collectible import Collectible
 from ..utils.network import NetworkClient
 
+# Stores HTTP cache validators and the dump they belong to. The name has no
+# .json suffix so it is not mistaken for an API dump.
+CACHE_META_FILENAME = ".cache_meta"
+
+# Validates and serializes whole collectible lists in one pass
+_COLLECTIBLES_ADAPTER = TypeAdapter(List[Collectible])
+
 
 class ApiService:
     """Service for interacting with CS:GO collectibles API"""
 
-    def __init__(self, base_url: str, timeout: int = 30, max_retries: int = 3):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        cache_folder: Optional[Path] = None,
+        network_client: Optional[NetworkClient] = None,
+    ):
         """Initialize API service
 
         Args:
             base_url: Base URL for the API
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            cache_folder: Optional directory holding API dumps; enables
+                conditional requests against the last dumped response
+            network_client: Optional shared network client; its session
+                and connection pool are reused for API requests
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
-        self.network_client = NetworkClient(
+        self.cache_folder = Path(cache_folder) if cache_folder else None
+        self.network_client = network_client or NetworkClient(
             timeout=timeout, max_retries=max_retries
         )
+        self._validators: dict = {}
+        self._cached_dump: Optional[Path] = None
 
-    async def fetch_collectibles(self) -> List[Collectible]:
+    def fetch_collectibles(self) -> List[Collectible]:
         """Fetch all collectibles from the API
 
         Returns:
@@ -42,28 +64,32 @@ class ApiService:
         logger.info(f"Fetching collectibles from {self.base_url}")
 
         try:
-            session = self.network_client.create_session()
-            response = session.get(self.base_url, timeout=self.timeout)
+            cache_meta = self._load_cache_meta()
+            response = self._request_collectibles(cache_meta)
+
+            if response.status_code == 304 and cache_meta:
+                collectibles = self._load_cached_dump(cache_meta["dump_file"])
+                if collectibles is not None:
+                    return collectibles
+
+                # The dump the validators point at is unusable; forget them
+                # and fetch the full payload
+                self._drop_cache_meta()
+                response = self._request_collectibles({})
+
             response.raise_for_status()
+            self._cached_dump = None
+            self._validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
 
-            raw_data = response.json()
+            payload = response.content
             logger.info(
-                f"Successfully fetched {len(raw_data)} raw collectibles"
+                f"Successfully fetched {len(payload)} bytes from the API"
             )
 
-            # Convert to Pydantic models
-            collectibles = []
-            for item_data in raw_data:
-                try:
-                    collectible = Collectible(**item_data)
-                    collectibles.append(collectible)
-                except Exception as e:
-                    item_id = item_data.get('id', 'unknown')
-                    logger.warning(
-                        f"Failed to parse collectible {item_id}: {e}"
-                    )
-                    continue
-
+            collectibles = self._decode_collectibles(payload)
             logger.info(
                 f"Successfully parsed {len(collectibles)} collectibles"
             )
@@ -73,9 +99,109 @@ class ApiService:
             logger.error(f"Failed to fetch collectibles: {e}")
             raise
 
+    def _request_collectibles(self, cache_meta: dict) -> requests.Response:
+        """Request the collectibles payload
+
+        Args:
+            cache_meta: Cache metadata; its validators make the request
+                conditional
+
+        Returns:
+            HTTP response
+        """
+        headers = {}
+        if cache_meta.get("etag"):
+            headers["If-None-Match"] = cache_meta["etag"]
+        if cache_meta.get("last_modified"):
+            headers["If-Modified-Since"] = cache_meta["last_modified"]
+
+        session = self.network_client.get_session()
+        return session.get(
+            self.base_url, headers=headers, timeout=self.timeout
+        )
+
+    def _load_cached_dump(self, dump_file: str) -> Optional[List[Collectible]]:
+        """Load collectibles from the dump the API reported as unmodified
+
+        Args:
+            dump_file: Dump file name inside the cache folder
+
+        Returns:
+            List of Collectible objects, or None if the dump is unusable
+        """
+        dump_path = self.cache_folder / dump_file
+        logger.info(f"Collectibles not modified, using {dump_path}")
+        try:
+            collectibles = self._decode_collectibles(dump_path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached dump {dump_path}: {e}")
+            return None
+
+        self._cached_dump = dump_path
+        logger.info(f"Successfully parsed {len(collectibles)} collectibles")
+        return collectibles
+
+    def _decode_collectibles(self, payload: bytes) -> List[Collectible]:
+        """Parse and validate a JSON payload of collectibles
+
+        The whole payload is decoded and validated in one pass without an
+        intermediate tree of dicts; only a payload with invalid items is
+        decoded again to skip them one by one.
+
+        Args:
+            payload: Raw JSON response body
+
+        Returns:
+            List of Collectible objects
+        """
+        try:
+            return _COLLECTIBLES_ADAPTER.validate_json(payload)
+        except ValidationError:
+            return self._parse_collectibles(orjson.loads(payload))
+
+    def _parse_collectibles(self, raw_data: list) -> List[Collectible]:
+        """Validate raw API items, skipping the ones that fail
+
+        Args:
+            raw_data: Decoded API payload
+
+        Returns:
+            List of Collectible objects
+
+        Raises:
+            ValidationError: If the payload itself is not a list
+        """
+        try:
+            return _COLLECTIBLES_ADAPTER.validate_python(raw_data)
+        except ValidationError as e:
+            # The first location element is the index of the failed item
+            failed = {}
+            for error in e.errors():
+                loc = error["loc"]
+                if loc and isinstance(loc[0], int):
+                    failed.setdefault(loc[0], error["msg"])
+            if not failed:
+                raise
+
+        for index, message in failed.items():
+            item_data = raw_data[index]
+            item_id = (
+                item_data.get("id", "unknown")
+                if isinstance(item_data, dict)
+                else "unknown"
+            )
+            logger.warning(f"Failed to parse collectible {item_id}: {message}")
+
+        valid_items = [
+            item_data
+            for index, item_data in enumerate(raw_data)
+            if index not in failed
+        ]
+        return _COLLECTIBLES_ADAPTER.validate_python(valid_items)
+
     def fetch_collectibles_sync(self) -> List[Collectible]:
-        """Synchronous version of fetch_collectibles"""
-        return asyncio.run(self.fetch_collectibles())
+        """Alias of fetch_collectibles, which is synchronous"""
+        return self.fetch_collectibles()
 
     def dump_collectibles(
         self, collectibles: List[Collectible], dump_folder: Path
@@ -87,11 +213,16 @@ class ApiService:
             dump_folder: Directory to save the dump file
 
         Returns:
-            Path to the created dump file
+            Path to the created dump file, or the existing dump if the
+            collectibles were served from it
         """
         if not collectibles:
             raise ValueError("No collectibles to dump")
 
+        # Nothing new to dump when the API reported no modification
+        if self._cached_dump is not None:
+            return self._cached_dump
+
         # Ensure dump folder exists
         dump_folder.mkdir(parents=True, exist_ok=True)
 
@@ -101,18 +232,78 @@ class ApiService:
         filepath = dump_folder / filename
 
         try:
-            # Convert Pydantic models to dict for JSON serialization
-            data = [collectible.model_dump() for collectible in collectibles]
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4, default=str)
+            # Serialize straight from the models to bytes, without an
+            # intermediate list of dicts
+            payload = _COLLECTIBLES_ADAPTER.dump_json(collectibles, indent=2)
+            filepath.write_bytes(payload)
 
             collectible_count = len(collectibles)
             logger.info(
                 f"Dumped {collectible_count} collectibles to {filepath}"
             )
+            self._save_cache_meta(filepath)
             return filepath
 
         except Exception as e:
             logger.error(f"Failed to dump collectibles: {e}")
             raise
+
+    def _load_cache_meta(self) -> dict:
+        """Load HTTP cache validators for the last dumped response
+
+        Returns:
+            Cache metadata, or an empty dict if unavailable or stale
+        """
+        if self.cache_folder is None:
+            return {}
+
+        meta_path = self.cache_folder / CACHE_META_FILENAME
+        try:
+            cache_meta = orjson.loads(meta_path.read_bytes())
+            if not isinstance(cache_meta, dict):
+                raise ValueError("expected a JSON object")
+            for key in ("etag", "last_modified"):
+                if not isinstance(cache_meta.get(key), (str, type(None))):
+                    raise ValueError(f"malformed {key}")
+            dump_file = cache_meta.get("dump_file")
+            if not isinstance(dump_file, str) or not dump_file:
+                raise ValueError("malformed dump_file")
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache metadata: {e}")
+            return {}
+
+        # Validators are useless without the dump they describe
+        if not (self.cache_folder / dump_file).is_file():
+            return {}
+
+        return cache_meta
+
+    def _drop_cache_meta(self) -> None:
+        """Remove the HTTP cache validators so the next request is full"""
+        try:
+            (self.cache_folder / CACHE_META_FILENAME).unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Failed to remove cache metadata: {e}")
+
+    def _save_cache_meta(self, dump_path: Path) -> None:
+        """Persist HTTP cache validators alongside a new dump
+
+        Args:
+            dump_path: Dump file holding the response the validators belong to
+        """
+        if self.cache_folder is None:
+            return
+        if not any(self._validators.values()):
+            return
+
+        cache_meta = {**self._validators, "dump_file": dump_path.name}
+        try:
+            self.cache_folder.mkdir(parents=True, exist_ok=True)
+            meta_path = self.cache_folder / CACHE_META_FILENAME
+            meta_path.write_bytes(
+                orjson.dumps(cache_meta, option=orjson.OPT_INDENT_2)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save cache metadata: {e}")
@@ -1,30 +1,210 @@
 """Main service for collectible processing and filtering"""
 
+import asyncio
+import multiprocessing
+import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import (TYPE_CHECKING, Dict, FrozenSet, Iterator, List, Optional,
+                    Tuple)
 
+import aiohttp
+import orjson
 from loguru import logger
+from PIL import Image
+
+if TYPE_CHECKING:
+    from loguru import Logger
 
 from ..models.collectible import (Collectible, CollectibleBatch,
                                   CollectibleFilter, ProcessingResult)
 from ..utils.image_processor import ImageProcessor
+from ..utils.network import IMAGE_REQUEST_HEADERS
+
+# Sidecar in the output folder mapping image name -> [width, height, bytes]
+DIMS_CACHE_FILENAME = ".dims.json"
+
+# Minimum seconds between two progress log lines
+PROGRESS_LOG_INTERVAL = 0.5
+
+# Workers are started from a clean server process rather than forked from
+# the parent, which by then runs the event loop and its helper threads.
+# Enqueued loguru sinks shared with the workers must use the same context.
+WORKER_START_METHOD = (
+    "forkserver"
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else None
+)
+
+# Per-process image processor, set up once by the process pool initializer
+_worker_image_processor: Optional[ImageProcessor] = None
+
+
+def _init_image_worker(
+    image_processor: ImageProcessor, parent_logger: Optional["Logger"]
+) -> None:
+    """Initialize a process pool worker
+
+    Args:
+        image_processor: Image processor configuration to use in the worker
+        parent_logger: Optional logger of the parent process; worker
+            records are forwarded to its sinks
+    """
+    global _worker_image_processor
+    if parent_logger is not None:
+        # A fresh worker imports loguru with its default DEBUG handler;
+        # hand every record to the parent's sinks, which apply their own
+        # level and format
+        def forward(message) -> None:
+            record = message.record
+            parent_logger.patch(lambda r: r.update(record)).log(
+                record["level"].name, record["message"]
+            )
+
+        logger.remove()
+        logger.add(forward, level=0, format="{message}", catch=False)
+
+    # Load Pillow's format plugins once instead of on the first decode
+    Image.init()
+    _worker_image_processor = image_processor
+
+
+def _process_image_bytes(img_data: bytes) -> Optional[bytes]:
+    """Decode, resize and encode raw image bytes in a worker process
+
+    Args:
+        img_data: Raw image data
+
+    Returns:
+        PNG file contents, or None if failed
+    """
+    return _worker_image_processor.encode_image_from_bytes(img_data)
+
+
+class _WriteBatcher:
+    """Background writer for processed images
+
+    A single writer task drains a queue of pending writes and puts up to
+    ``batch_size`` files on disk per executor hop, so write latency
+    overlaps with ongoing downloads and decodes.
+    """
+
+    def __init__(self, dir_fd: Optional[int], flush_threshold: int = 32):
+        """Initialize write batcher
+
+        Args:
+            dir_fd: Optional descriptor of the output folder
+            flush_threshold: Maximum number of files written per batch
+        """
+        self.dir_fd = dir_fd
+        self.flush_threshold = flush_threshold
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "_WriteBatcher":
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._writer())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # The sentinel is queued behind any pending writes
+        await self._queue.put(None)
+        await self._task
+
+    async def write(self, output_path: Path, png_data: bytes) -> None:
+        """Queue a file write and wait until it is on disk
+
+        Args:
+            output_path: Path where to save the image
+            png_data: PNG file contents
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((output_path, png_data, future))
+        await future
+
+    async def _writer(self) -> None:
+        """Drain the queue in batches until the sentinel is reached"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.flush_threshold:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            await self._flush(loop, batch)
+            if stop:
+                return
+
+    async def _flush(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batch: List[Tuple[Path, bytes, asyncio.Future]],
+    ) -> None:
+        """Write one batch of files off the event loop
+
+        Args:
+            loop: Running event loop
+            batch: Pending writes with the futures to resolve
+        """
+        try:
+            errors = await loop.run_in_executor(
+                None,
+                ImageProcessor.write_png_batch,
+                [(path, data) for path, data, _ in batch],
+                self.dir_fd,
+            )
+        except Exception as e:
+            errors = [e] * len(batch)
+
+        for (_, _, future), error in zip(batch, errors):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
 
 
 class CollectibleService:
     """Service for processing and filtering collectibles"""
 
-    def __init__(self, image_processor: ImageProcessor, max_workers: int = 10):
+    def __init__(
+        self,
+        image_processor: ImageProcessor,
+        max_workers: int = 10,
+        forward_worker_logs: bool = False,
+    ):
         """Initialize collectible service
 
         Args:
             image_processor: Image processing utility
-            max_workers: Maximum number of concurrent workers
+            max_workers: Maximum number of concurrent workers; the
+                number of in-flight downloads is a multiple of this
+            forward_worker_logs: Send image worker log records to this
+                process's loguru sinks; every sink must be added with
+                enqueue=True and context=WORKER_START_METHOD
         """
         self.image_processor = image_processor
         self.max_workers = max_workers
-        self._compiled_patterns = {}
+        self.forward_worker_logs = forward_worker_logs
+        self.max_concurrent_downloads = max_workers * 5
+        self.cpu_workers = os.cpu_count() or 1
 
     def filter_collectibles(
         self, collectibles: List[Collectible], filter_config: CollectibleFilter
@@ -48,53 +228,47 @@ class CollectibleService:
             f"Filtering {collectible_count} items for types: {filter_types}"
         )
 
-        # Create optimized regex pattern
-        pattern = self._get_compiled_pattern(filter_config.types)
-
-        batch = CollectibleBatch(total_count=len(collectibles))
+        # Get the cached regex pattern and exact-match type set
+        pattern = filter_config.get_pattern()
+        type_set = filter_config.get_type_set()
 
+        matched = []
         for collectible in collectibles:
             try:
-                if self._matches_filter(collectible, pattern, filter_config):
-                    batch.add_collectible(collectible)
+                if self._matches_filter(
+                    collectible, pattern, type_set, filter_config
+                ):
+                    matched.append(collectible)
             except Exception as e:
                 logger.warning(
                     f"Error filtering collectible {collectible.id}: {e}"
                 )
                 continue
 
+        # Build the batch once instead of appending and recounting through
+        # add_collectible for every match
+        batch = CollectibleBatch(
+            items=matched,
+            total_count=collectible_count,
+            filtered_count=len(matched),
+        )
+
         logger.info(f"Found {batch.filtered_count} matching collectibles")
         return batch
 
-    def _get_compiled_pattern(self, types: List[str]) -> re.Pattern:
-        """Get or create compiled regex pattern for types
-
-        Args:
-            types: List of types to match
-
-        Returns:
-            Compiled regex pattern
-        """
-        types_key = tuple(sorted(types))
-
-        if types_key not in self._compiled_patterns:
-            escaped_terms = [re.escape(term) for term in types]
-            pattern_str = r"(?i)\b(?:" + "|".join(escaped_terms) + r")\b"
-            self._compiled_patterns[types_key] = re.compile(pattern_str)
-
-        return self._compiled_patterns[types_key]
-
     def _matches_filter(
         self,
         collectible: Collectible,
         pattern: re.Pattern,
+        type_set: FrozenSet[str],
         filter_config: CollectibleFilter,
     ) -> bool:
         """Check if collectible matches filter criteria
 
         Args:
             collectible: Collectible to check
-            pattern: Compiled regex pattern
+            pattern: Compiled case-insensitive regex pattern
+            type_set: Lowercase types for exact type matches
             filter_config: Filter configuration
 
         Returns:
@@ -104,17 +278,20 @@ class CollectibleService:
         if filter_config.require_image and not collectible.image:
             return False
 
-        # Check type field
-        if collectible.type and pattern.search(collectible.type.lower()):
-            return True
-
-        # Check name and description
-        name_description = (
-            f"{collectible.name or ''} {collectible.description or ''}".lower()
-        )
-        if pattern.search(name_description):
+        # Exact type match needs no regex at all
+        collectible_type = collectible.type
+        if collectible_type and collectible_type.strip().lower() in type_set:
             return True
 
+        # Otherwise scan each populated field, cheapest first, stopping at
+        # the first match; no combined string is built
+        for text in (
+            collectible_type,
+            collectible.name,
+            collectible.description,
+        ):
+            if text and pattern.search(text) is not None:
+                return True
         return False
 
     def process_images_concurrent(
@@ -122,6 +299,10 @@ class CollectibleService:
     ) -> List[ProcessingResult]:
         """Process images concurrently
 
+        Downloads run on a single asyncio event loop sharing one
+        keep-alive connection pool, while decoding, resizing and encoding
+        is offloaded to a process pool with one worker per CPU core.
+
         Args:
             collectibles: List of collectibles to process
             output_folder: Directory to save processed images
@@ -137,68 +318,277 @@ class CollectibleService:
         collectibles_with_images = [c for c in collectibles if c.image]
         image_count = len(collectibles_with_images)
         logger.info(
-            f"Processing {image_count} images with {self.max_workers} workers"
+            f"Processing {image_count} images with "
+            f"{self.max_concurrent_downloads} concurrent downloads"
         )
 
         # Ensure output folder exists
         output_folder.mkdir(parents=True, exist_ok=True)
 
-        results = []
-        successful_downloads = 0
-        failed_downloads = 0
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all download tasks
-            future_to_collectible = {
-                executor.submit(
-                    self._process_single_image, collectible, output_folder
-                ): collectible
-                for collectible in collectibles_with_images
-            }
-
-            # Process completed downloads with progress tracking
-            for future in as_completed(future_to_collectible):
-                result = future.result()
-                results.append(result)
-
-                if result.success:
-                    successful_downloads += 1
-                    logger.debug(
-                        f"Successfully processed: {result.image_name}"
-                    )
-                else:
-                    failed_downloads += 1
-                    logger.warning(f"Failed to process: {result.image_name}")
-
-                # Log progress every 10 completions
-                total_completed = successful_downloads + failed_downloads
-                if total_completed % 10 == 0 or total_completed == len(
-                    collectibles_with_images
-                ):
-                    total_images = len(collectibles_with_images)
-                    logger.info(
-                        f"Progress: {total_completed}/{total_images} processed"
-                    )
+        known_dims = self._load_known_dimensions(output_folder)
+        results = asyncio.run(
+            self._process_all(
+                collectibles_with_images, output_folder, known_dims
+            )
+        )
+        self._save_known_dimensions(output_folder, known_dims)
 
+        successful_downloads = sum(1 for r in results if r.success)
+        failed_downloads = len(results) - successful_downloads
         logger.info(
             f"Image processing complete: {successful_downloads} successful, "
             f"{failed_downloads} failed"
         )
         return results
 
-    def _process_single_image(
-        self, collectible: Collectible, output_folder: Path
+    def _load_known_dimensions(
+        self, output_folder: Path
+    ) -> Dict[str, Tuple[int, int, int]]:
+        """Load cached dimensions of images already in the output folder
+
+        The folder is scanned once; cache entries are only kept when the
+        file still exists with the recorded byte size.
+
+        Args:
+            output_folder: Directory with processed images
+
+        Returns:
+            Mapping of image name to (width, height, file size)
+        """
+        try:
+            cached = orjson.loads(
+                (output_folder / DIMS_CACHE_FILENAME).read_bytes()
+            )
+            if not isinstance(cached, dict):
+                raise ValueError("expected a JSON object")
+            for name, entry in cached.items():
+                if not (
+                    isinstance(entry, list)
+                    and len(entry) == 3
+                    and all(type(value) is int for value in entry)
+                ):
+                    raise ValueError(f"malformed entry for {name}")
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable dimensions cache: {e}")
+            return {}
+
+        with os.scandir(output_folder) as entries:
+            file_sizes = {
+                entry.name: entry.stat().st_size
+                for entry in entries
+                if entry.name.endswith(".png")
+            }
+
+        known_dims = {}
+        for name, entry in cached.items():
+            width, height, size = entry
+            if file_sizes.get(name) == size:
+                known_dims[name] = (width, height, size)
+
+        return known_dims
+
+    def _save_known_dimensions(
+        self, output_folder: Path, known_dims: Dict[str, Tuple[int, int, int]]
+    ) -> None:
+        """Persist the dimensions cache for the next run
+
+        Args:
+            output_folder: Directory with processed images
+            known_dims: Mapping of image name to (width, height, file size)
+        """
+        try:
+            (output_folder / DIMS_CACHE_FILENAME).write_bytes(
+                orjson.dumps(known_dims)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save dimensions cache: {e}")
+
+    async def _process_all(
+        self,
+        collectibles: List[Collectible],
+        output_folder: Path,
+        known_dims: Dict[str, Tuple[int, int, int]],
+    ) -> List[ProcessingResult]:
+        """Download and process all images on one event loop
+
+        Args:
+            collectibles: Collectibles with image URLs
+            output_folder: Directory to save processed images
+            known_dims: Cached image dimensions, updated in place
+
+        Returns:
+            List of processing results
+        """
+        network_client = self.image_processor.network_client
+        progress = {
+            "completed": 0,
+            "total": len(collectibles),
+            "next_log": time.monotonic() + PROGRESS_LOG_INTERVAL,
+        }
+        results: List[Optional[ProcessingResult]] = [None] * len(collectibles)
+
+        # A fixed set of workers pulls from one shared iterator, so only
+        # max_concurrent_downloads items are in flight at any time
+        work = iter(enumerate(collectibles))
+        worker_count = min(self.max_concurrent_downloads, len(collectibles))
+
+        # Write files relative to one descriptor of the output folder
+        dir_fd = None
+        if os.open in os.supports_dir_fd:
+            dir_fd = os.open(output_folder, os.O_RDONLY | os.O_DIRECTORY)
+
+        cpu_pool = ProcessPoolExecutor(
+            max_workers=self.cpu_workers,
+            mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+            initializer=_init_image_worker,
+            initargs=(
+                self.image_processor,
+                logger if self.forward_worker_logs else None,
+            ),
+        )
+        try:
+            with cpu_pool:
+                # Images share one CDN host, so the per-host cap must not
+                # throttle the workers below max_concurrent_downloads
+                async with network_client.create_async_session(
+                    limit=self.max_workers * 10,
+                    limit_per_host=self.max_concurrent_downloads,
+                ) as session, _WriteBatcher(dir_fd) as writer:
+                    await asyncio.gather(
+                        *(
+                            self._process_worker(
+                                session,
+                                cpu_pool,
+                                writer,
+                                work,
+                                results,
+                                output_folder,
+                                known_dims,
+                                progress,
+                            )
+                            for _ in range(worker_count)
+                        )
+                    )
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+        return results
+
+    async def _process_worker(
+        self,
+        session: aiohttp.ClientSession,
+        cpu_pool: Executor,
+        writer: _WriteBatcher,
+        work: Iterator[Tuple[int, Collectible]],
+        results: List[Optional[ProcessingResult]],
+        output_folder: Path,
+        known_dims: Dict[str, Tuple[int, int, int]],
+        progress: dict,
+    ) -> None:
+        """Process collectibles from a shared work iterator until exhausted
+
+        Args:
+            session: Shared aiohttp session
+            cpu_pool: Executor for decoding and resizing
+            writer: Batched writer for processed images
+            work: Shared iterator of (result index, collectible)
+            results: Result slots, filled in place
+            output_folder: Directory to save processed images
+            known_dims: Cached image dimensions, updated in place
+            progress: Shared completion state for progress logging
+        """
+        for index, collectible in work:
+            results[index] = await self._process_single_image_async(
+                session,
+                cpu_pool,
+                writer,
+                collectible,
+                output_folder,
+                known_dims,
+                progress,
+            )
+
+    async def _process_single_image_async(
+        self,
+        session: aiohttp.ClientSession,
+        cpu_pool: Executor,
+        writer: _WriteBatcher,
+        collectible: Collectible,
+        output_folder: Path,
+        known_dims: Dict[str, Tuple[int, int, int]],
+        progress: dict,
     ) -> ProcessingResult:
-        """Process a single collectible image
+        """Download a single collectible image and process it
 
         Args:
+            session: Shared aiohttp session
+            cpu_pool: Executor for decoding and resizing
+            writer: Batched writer for processed images
             collectible: Collectible to process
             output_folder: Directory to save the image
+            known_dims: Cached image dimensions, updated in place
+            progress: Shared completion state for progress logging
 
         Returns:
             ProcessingResult with operation details
         """
-        collectible_id = collectible.id.replace("collectible-", "")
+        result = await self._download_and_process_async(
+            session,
+            cpu_pool,
+            writer,
+            collectible,
+            output_folder,
+            known_dims,
+        )
+
+        # Failures are counted in the final summary; per-item details are
+        # only formatted when debug logging is enabled
+        if not result.success:
+            logger.debug(
+                "Failed to process: {} ({})",
+                result.image_name,
+                result.error_message,
+            )
+
+        # Log progress at a fixed interval rather than per item
+        progress["completed"] += 1
+        total_completed = progress["completed"]
+        total_images = progress["total"]
+        now = time.monotonic()
+        if now >= progress["next_log"] or total_completed == total_images:
+            progress["next_log"] = now + PROGRESS_LOG_INTERVAL
+            logger.info(
+                "Progress: {}/{} processed", total_completed, total_images
+            )
+
+        return result
+
+    async def _download_and_process_async(
+        self,
+        session: aiohttp.ClientSession,
+        cpu_pool: Executor,
+        writer: _WriteBatcher,
+        collectible: Collectible,
+        output_folder: Path,
+        known_dims: Dict[str, Tuple[int, int, int]],
+    ) -> ProcessingResult:
+        """Download and process a single collectible image
+
+        Args:
+            session: Shared aiohttp session
+            cpu_pool: Executor for decoding and resizing
+            writer: Batched writer for processed images
+            collectible: Collectible to process
+            output_folder: Directory to save the image
+            known_dims: Cached image dimensions, updated in place
+
+        Returns:
+            ProcessingResult with operation details
+        """
+        collectible_id = collectible.image_id
         image_name = f"{collectible_id}.png"
         image_path = output_folder / image_name
 
@@ -211,12 +601,62 @@ class CollectibleService:
                     error_message="No image URL provided",
                 )
 
-            # Use image processor to download and process
-            success = self.image_processor.download_and_process_image(
-                image_url=str(collectible.image), output_path=image_path
+            # Skip images that already exist with correct dimensions,
+            # trusting the dimensions cache before reading the file header.
+            # File system calls run on the default executor so a slow disk
+            # does not stall the downloads sharing the event loop.
+            loop = asyncio.get_running_loop()
+            target_size = (
+                self.image_processor.target_width,
+                self.image_processor.target_height,
+            )
+            cached_dims = known_dims.get(image_name)
+            already_processed = (
+                cached_dims is not None and cached_dims[:2] == target_size
+            )
+            if not already_processed and await loop.run_in_executor(
+                None, self.image_processor.is_already_processed, image_path
+            ):
+                known_dims[image_name] = (
+                    *target_size,
+                    await loop.run_in_executor(
+                        None, os.path.getsize, image_path
+                    ),
+                )
+                already_processed = True
+
+            if already_processed:
+                return ProcessingResult(
+                    collectible_id=collectible_id,
+                    image_name=image_name,
+                    success=True,
+                    file_path=str(image_path),
+                )
+
+            image_url = str(collectible.image)
+            network_client = self.image_processor.network_client
+            img_data = await network_client.download_async(
+                image_url, session, headers=IMAGE_REQUEST_HEADERS
+            )
+
+            if not img_data:
+                return ProcessingResult(
+                    collectible_id=collectible_id,
+                    image_name=image_name,
+                    success=False,
+                    error_message=f"Failed to download image from {image_url}",
+                )
+
+            # Decode, resize and encode off the event loop; only raw and
+            # encoded bytes cross the process boundary
+            png_data = await loop.run_in_executor(
+                cpu_pool, _process_image_bytes, img_data
             )
 
-            if success:
+            if png_data is not None:
+                await writer.write(image_path, png_data)
+                # The written file is exactly the encoded bytes
+                known_dims[image_name] = (*target_size, len(png_data))
                 return ProcessingResult(
                     collectible_id=collectible_id,
                     image_name=image_name,
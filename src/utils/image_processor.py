@@ -1,13 +1,59 @@
 """Image processing utilities"""
 
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, List, Optional, Set, Tuple
 
+import PIL
 from loguru import logger
-from PIL import Image
+from PIL import Image, UnidentifiedImageError, features
 
-from .network import NetworkClient
+from .network import IMAGE_REQUEST_HEADERS, NetworkClient
+
+# Leading bytes of the image formats served by the API
+IMAGE_SIGNATURES = (
+    b"\x89PNG\r\n\x1a\n",
+    b"\xff\xd8\xff",
+    b"GIF87a",
+    b"GIF89a",
+)
+
+# libimagequant gives the best palettes but is an optional Pillow feature;
+# fast octree is the built-in method that also handles RGBA
+_QUANTIZE_METHOD = (
+    Image.Quantize.LIBIMAGEQUANT
+    if features.check_feature("libimagequant")
+    else Image.Quantize.FASTOCTREE
+)
+
+# Processed PNGs kept in memory, keyed by source URL
+PROCESSED_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=1024)
+def _read_image_size(
+    path: str, mtime_ns: int, file_size: int
+) -> Tuple[int, int]:
+    """Read an image's dimensions from its header
+
+    The modification time and size are part of the cache key, so a
+    rewritten file is read again.
+
+    Args:
+        path: Path of the image file
+        mtime_ns: File modification time in nanoseconds
+        file_size: File size in bytes
+
+    Returns:
+        Tuple of (width, height)
+    """
+    with Image.open(path) as img:
+        return img.size
 
 
 class ImageProcessor:
@@ -18,6 +64,11 @@ class ImageProcessor:
         target_width: int = 256,
         target_height: int = 192,
         network_client: Optional[NetworkClient] = None,
+        compress_level: int = 1,
+        resample: Image.Resampling = Image.Resampling.BICUBIC,
+        reducing_gap: Optional[float] = 2.0,
+        optimize_png: bool = False,
+        quantize: bool = False,
     ):
         """Initialize image processor
 
@@ -25,43 +76,104 @@ class ImageProcessor:
             target_width: Target image width in pixels
             target_height: Target image height in pixels
             network_client: Optional network client for downloads
+            compress_level: zlib compression level (0-9) for saved PNGs
+            resample: Resampling filter for downscaling; BICUBIC is close
+                to LANCZOS at thumbnail sizes for about half the cost
+            reducing_gap: Box-reduce large sources to this multiple of the
+                target before resampling; None resamples in one pass
+            optimize_png: Let zlib search for the smallest encoding; much
+                slower, meant for archival runs
+            quantize: Convert to a 256-colour palette before saving for
+                smaller files
         """
         self.target_width = target_width
         self.target_height = target_height
         self.network_client = network_client or NetworkClient()
+        self.compress_level = compress_level
+        self.resample = resample
+        self.reducing_gap = reducing_gap
+        self.optimize_png = optimize_png
+        self.quantize = quantize
+        self._processed_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Outputs known to be up to date in this process
+        self._verified_outputs: Set[Path] = set()
+
+    def __getstate__(self) -> dict:
+        """Drop the in-process caches when pickled into workers"""
+        state = self.__dict__.copy()
+        del state["_processed_cache"]
+        del state["_cache_lock"]
+        del state["_verified_outputs"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled processor with empty caches"""
+        self.__dict__.update(state)
+        self._processed_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._verified_outputs = set()
+
+    @staticmethod
+    def get_pillow_build() -> str:
+        """Describe the Pillow build used for resampling
+
+        pillow-simd is a drop-in replacement whose releases carry a
+        ``.postN`` version suffix.
+
+        Returns:
+            Human-readable Pillow version, build flavour and JPEG decoder
+        """
+        version = PIL.__version__
+        flavour = "pillow-simd" if ".post" in version else "Pillow"
+        jpeg = (
+            "libjpeg-turbo"
+            if features.check_feature("libjpeg_turbo")
+            else "libjpeg"
+        )
+        return f"{flavour} {version} ({jpeg})"
 
     def validate_image_data(self, img_data: bytes) -> bool:
-        """Validate if the downloaded data is a valid image
+        """Check if the downloaded data starts like a supported image
+
+        Only the file signature is inspected, which is enough to reject
+        error pages and other obvious garbage; full validation happens
+        when the image is decoded.
 
         Args:
             img_data: Raw image data bytes
 
         Returns:
-            True if data is a valid image
+            True if data has a PNG, JPEG, GIF or WebP signature
         """
-        try:
-            img = Image.open(BytesIO(img_data))
-            img.verify()
-            return True
-        except Exception:
-            return False
+        if img_data[:4] == b"RIFF":
+            return img_data[8:12] == b"WEBP"
+        return img_data.startswith(IMAGE_SIGNATURES)
 
-    def resize_and_pad_image(self, img: Image.Image) -> Image.Image:
+    def resize_and_pad_image(
+        self, img: Image.Image, copy: bool = False
+    ) -> Image.Image:
         """Resize image maintaining aspect ratio and pad to target dimensions
 
+        The input image is shrunk in place unless ``copy`` is set.
+
         Args:
             img: PIL Image object
+            copy: Work on a copy and leave the input image untouched
 
         Returns:
             Processed PIL Image object
         """
-        # Create a copy to avoid modifying the original
-        img = img.copy()
+        if copy:
+            img = img.copy()
 
         # Resize while maintaining aspect ratio
         target_size = (self.target_width, self.target_height)
-        resample = Image.LANCZOS
-        img.thumbnail(target_size, resample)
+        img.thumbnail(target_size, self.resample, self.reducing_gap)
+
+        # No padding needed when the thumbnail already fills the target
+        if img.size == target_size:
+            return img if img.mode == "RGBA" else img.convert("RGBA")
 
         # Calculate padding for centering
         padding_left = (self.target_width - img.width) // 2
@@ -83,25 +195,166 @@ class ImageProcessor:
         Args:
             img_data: Raw image data
 
+        Returns:
+            Processed PIL Image object or None if failed
+        """
+        return self.process_image_from_file(BytesIO(img_data))
+
+    def process_image_from_file(
+        self, fp: BinaryIO
+    ) -> Optional[Image.Image]:
+        """Process image from a binary file-like object
+
+        Args:
+            fp: Binary stream positioned at the start of the image
+
         Returns:
             Processed PIL Image object or None if failed
         """
         try:
-            # Validate image data
-            if not self.validate_image_data(img_data):
-                logger.error("Invalid image data provided")
+            # A single open + full decode doubles as validation
+            try:
+                img = Image.open(fp)
+                # Let JPEG sources decode at a reduced scale; keep 2x the
+                # target so resampling still has detail to work with.
+                # No-op for other formats
+                img.draft(
+                    "RGB", (self.target_width * 2, self.target_height * 2)
+                )
+                img.load()
+            except (UnidentifiedImageError, OSError) as e:
+                logger.error(f"Invalid image data provided: {e}")
                 return None
 
-            # Open and process image
-            img = Image.open(BytesIO(img_data))
             processed_img = self.resize_and_pad_image(img)
 
             return processed_img
 
         except Exception as e:
-            logger.error(f"Error processing image from bytes: {e}")
+            logger.error(f"Error processing image: {e}")
             return None
 
+    def is_already_processed(self, output_path: Path) -> bool:
+        """Check if an image already exists with the target dimensions
+
+        Args:
+            output_path: Path of the processed image
+
+        Returns:
+            True if the image exists and does not need processing
+        """
+        try:
+            stat = output_path.stat()
+        except FileNotFoundError:
+            return False
+
+        try:
+            size = _read_image_size(
+                str(output_path), stat.st_mtime_ns, stat.st_size
+            )
+            if size == (self.target_width, self.target_height):
+                return True
+            logger.info(f"Resizing existing image {output_path.name}")
+        except Exception as e:
+            image_name = output_path.name
+            logger.warning(
+                f"Image {image_name} corrupted, re-downloading: {e}"
+            )
+
+        return False
+
+    def encode_image_from_bytes(self, img_data: bytes) -> Optional[bytes]:
+        """Process raw image bytes and encode the result as PNG
+
+        Args:
+            img_data: Raw image data
+
+        Returns:
+            PNG file contents, or None if failed
+        """
+        processed_img = self.process_image_from_bytes(img_data)
+        if not processed_img:
+            return None
+
+        try:
+            return self.encode_png(processed_img)
+        except Exception as e:
+            logger.error(f"Error encoding image: {e}")
+            return None
+
+    def encode_png(self, img: Image.Image) -> bytes:
+        """Encode a processed image as PNG
+
+        Args:
+            img: Processed PIL Image object
+
+        Returns:
+            PNG file contents
+        """
+        if self.quantize:
+            img = img.quantize(method=_QUANTIZE_METHOD)
+
+        buffer = BytesIO()
+        img.save(
+            buffer,
+            "PNG",
+            optimize=self.optimize_png,
+            compress_level=self.compress_level,
+        )
+        return buffer.getvalue()
+
+    @staticmethod
+    def write_png(
+        output_path: Path, png_data: bytes, dir_fd: Optional[int] = None
+    ) -> None:
+        """Write encoded PNG data to disk
+
+        Args:
+            output_path: Path where to save the image
+            png_data: PNG file contents
+            dir_fd: Optional descriptor of the output folder; the file is
+                then opened relative to it, skipping path resolution
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        path = output_path.name if dir_fd is not None else output_path
+        fd = os.open(
+            path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd
+        )
+        try:
+            # Unbuffered writes straight from the encoded bytes
+            with memoryview(png_data) as view:
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def write_png_batch(
+        cls,
+        batch: List[Tuple[Path, bytes]],
+        dir_fd: Optional[int] = None,
+    ) -> List[Optional[OSError]]:
+        """Write several encoded PNG files in one call
+
+        Args:
+            batch: List of (output path, PNG file contents)
+            dir_fd: Optional descriptor of the output folder
+
+        Returns:
+            Per-file error, or None for each file written
+        """
+        errors: List[Optional[OSError]] = []
+        for output_path, png_data in batch:
+            try:
+                cls.write_png(output_path, png_data, dir_fd)
+                errors.append(None)
+            except OSError as e:
+                errors.append(e)
+        return errors
+
     def download_and_process_image(
         self, image_url: str, output_path: Path
     ) -> bool:
@@ -116,45 +369,19 @@ class ImageProcessor:
         """
         try:
             # Check if image already exists with correct dimensions
-            if output_path.exists():
-                try:
-                    with Image.open(output_path) as existing_img:
-                        if existing_img.size == (
-                            self.target_width,
-                            self.target_height,
-                        ):
-                            return True  # Already processed correctly
-                        else:
-                            logger.info(
-                                f"Resizing existing image {output_path.name}"
-                            )
-                except Exception as e:
-                    image_name = output_path.name
-                    logger.warning(
-                        f"Image {image_name} corrupted, re-downloading: {e}"
-                    )
-
-            # Download image data
-            session = self.network_client.create_session()
-            img_data = self.network_client.download_with_retry(
-                image_url, session
-            )
-            session.close()
-
-            if not img_data:
-                logger.error(f"Failed to download image from {image_url}")
-                return False
-
-            # Process image
-            processed_img = self.process_image_from_bytes(img_data)
-            if not processed_img:
-                logger.error(f"Failed to process image from {image_url}")
+            if output_path in self._verified_outputs:
+                return True
+            if self.is_already_processed(output_path):
+                self._verified_outputs.add(output_path)
+                return True
+
+            png_data = self._fetch_processed_png(image_url)
+            if png_data is None:
                 return False
 
-            # Save processed image
-            processed_img.save(output_path, "PNG", optimize=True)
-            logger.debug(f"Successfully saved image: {output_path}")
-
+            self.write_png(output_path, png_data)
+            self._verified_outputs.add(output_path)
+            logger.debug("Successfully saved image: {}", output_path)
             return True
 
         except Exception as e:
@@ -163,6 +390,81 @@ class ImageProcessor:
             )
             return False
 
+    def download_and_process_images(
+        self, jobs: List[Tuple[str, Path]], max_workers: int = 16
+    ) -> List[bool]:
+        """Download and process several images concurrently
+
+        Downloads and decodes overlap across threads and share the network
+        client's session; its pool_size should be at least max_workers.
+
+        Args:
+            jobs: List of (image URL, output path)
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Success flag for each job, in order
+        """
+        if not jobs:
+            return []
+
+        urls, output_paths = zip(*jobs)
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(jobs))
+        ) as executor:
+            return list(
+                executor.map(
+                    self.download_and_process_image, urls, output_paths
+                )
+            )
+
+    def _fetch_processed_png(self, image_url: str) -> Optional[bytes]:
+        """Download, process and encode an image, reusing recent results
+
+        Medals sharing a source image are only downloaded and decoded once
+        per processor.
+
+        Args:
+            image_url: URL of the image to download
+
+        Returns:
+            PNG file contents, or None if failed
+        """
+        with self._cache_lock:
+            png_data = self._processed_cache.get(image_url)
+            if png_data is not None:
+                self._processed_cache.move_to_end(image_url)
+                return png_data
+
+        # Stream the body into this thread's reusable buffer; the raw
+        # stream is not seekable, so Pillow would otherwise re-buffer it
+        # itself
+        response = self.network_client.open_stream(
+            image_url, headers=IMAGE_REQUEST_HEADERS
+        )
+        if response is None:
+            logger.error(f"Failed to download image from {image_url}")
+            return None
+
+        buffer = self.network_client.get_read_buffer()
+        try:
+            with self.network_client.read_stream(response, buffer) as img_data:
+                image_file = BytesIO(img_data)
+        finally:
+            response.close()
+
+        processed_img = self.process_image_from_file(image_file)
+        if not processed_img:
+            logger.error(f"Failed to process image from {image_url}")
+            return None
+
+        png_data = self.encode_png(processed_img)
+        with self._cache_lock:
+            self._processed_cache[image_url] = png_data
+            if len(self._processed_cache) > PROCESSED_CACHE_SIZE:
+                self._processed_cache.popitem(last=False)
+        return png_data
+
     def get_image_dimensions(
         self, image_path: Path
     ) -> Optional[Tuple[int, int]]:
@@ -175,8 +477,10 @@ class ImageProcessor:
             Tuple of (width, height) or None if failed
         """
         try:
-            with Image.open(image_path) as img:
-                return img.size
+            stat = image_path.stat()
+            return _read_image_size(
+                str(image_path), stat.st_mtime_ns, stat.st_size
+            )
         except Exception as e:
             logger.error(f"Error getting dimensions for {image_path}: {e}")
             return None
@@ -1,25 +1,113 @@
 """Network utilities for HTTP requests"""
 
-from typing import Optional
+import asyncio
+import atexit
+import threading
+from functools import lru_cache
+from typing import Optional, Union
 
+import aiohttp
 import requests
 from loguru import logger
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_ALLOWED_METHODS = frozenset({"HEAD", "GET", "OPTIONS"})
+
+# Initial buffer size when a response has no Content-Length
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Initial size of the per-thread reusable download buffer
+READ_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Images are already compressed; asking for identity avoids gzip overhead
+IMAGE_REQUEST_HEADERS = {"Accept-Encoding": "identity"}
+
+
+@lru_cache(maxsize=None)
+def _retry_strategy(max_retries: int) -> Retry:
+    """Get the shared retry strategy for a retry budget
+
+    Retry objects are never mutated (urllib3 derives a new one per
+    attempt), so one instance is safely shared by all sessions.
+
+    Args:
+        max_retries: Maximum number of retry attempts
+
+    Returns:
+        Retry strategy for requests sessions
+    """
+    return Retry(
+        total=max_retries,
+        backoff_factor=1,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+    )
+
 
 class NetworkClient:
     """HTTP client with retry strategy and connection pooling"""
 
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(
+        self, timeout: int = 30, max_retries: int = 3, pool_size: int = 32
+    ):
         """Initialize network client
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            pool_size: Keep-alive connections per host; should be at least
+                the number of concurrent workers
         """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.pool_size = pool_size
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict:
+        """Drop the live session, lock and buffers when pickled into workers"""
+        state = self.__dict__.copy()
+        state["_session"] = None
+        del state["_session_lock"]
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled client with a fresh lock"""
+        self.__dict__.update(state)
+        self._session_lock = threading.Lock()
+        self._local = threading.local()
+
+    def get_session(self) -> requests.Session:
+        """Get the shared session, creating it on first use
+
+        All callers share one retry adapter and keep-alive connection pool.
+
+        Returns:
+            Shared requests session
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self.create_session()
+                    atexit.register(self.close)
+        return self._session
+
+    @property
+    def session(self) -> requests.Session:
+        """Shared session, created on first access"""
+        return self.get_session()
+
+    def close(self) -> None:
+        """Close the shared session and release its connections"""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+                atexit.unregister(self.close)
 
     def create_session(self) -> requests.Session:
         """Create a requests session with retry strategy and connection pooling
@@ -29,15 +117,13 @@ class NetworkClient:
         """
         session = requests.Session()
 
-        retry_strategy = Retry(
-            total=self.max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-        )
-
+        # Block instead of discarding connections when the pool is full,
+        # so every worker keeps reusing a warm keep-alive socket
         adapter = HTTPAdapter(
-            max_retries=retry_strategy, pool_connections=20, pool_maxsize=20
+            max_retries=_retry_strategy(self.max_retries),
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            pool_block=True,
         )
 
         session.mount("http://", adapter)
@@ -46,27 +132,203 @@ class NetworkClient:
         return session
 
     def download_with_retry(
-        self, url: str, session: Optional[requests.Session] = None
+        self,
+        url: str,
+        session: Optional[requests.Session] = None,
+        max_size: Optional[int] = None,
     ) -> Optional[bytes]:
         """Download content with retry logic
 
+        The body is streamed into a single buffer sized from
+        Content-Length and copied once into immutable bytes.
+
         Args:
             url: URL to download from
-            session: Optional existing session to reuse
+            session: Optional session to use instead of the shared one
+            max_size: Optional limit in bytes; larger responses announced
+                by Content-Length are rejected before reading the body
 
         Returns:
-            Downloaded content as bytes, or None if failed
+            Downloaded content, or None if failed
+        """
+        response = self.open_stream(url, session)
+        if response is None:
+            return None
+
+        try:
+            if max_size is not None:
+                length = int(response.headers.get("Content-Length") or 0)
+                if length > max_size:
+                    logger.error(
+                        f"Response from {url} too large: {length} bytes"
+                    )
+                    return None
+            return bytes(self.read_stream(response))
+        except Exception as e:
+            logger.error(f"Unexpected error downloading from {url}: {e}")
+            return None
+        finally:
+            response.close()
+
+    def open_stream(
+        self,
+        url: str,
+        session: Optional[requests.Session] = None,
+        headers: Optional[dict] = None,
+    ) -> Optional[requests.Response]:
+        """Open a streaming response whose body is read on demand
+
+        The caller must close the returned response to release its
+        connection back to the pool.
+
+        Args:
+            url: URL to download from
+            session: Optional session to use instead of the shared one
+            headers: Optional extra request headers
+
+        Returns:
+            Streaming response with transparent content decoding,
+            or None if failed
         """
         if session is None:
-            session = self.create_session()
+            session = self.get_session()
 
         try:
-            response = session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.content
+            response = session.get(
+                url, headers=headers, timeout=self.timeout, stream=True
+            )
         except requests.RequestException as e:
             logger.error(f"Network error downloading from {url}: {e}")
             return None
-        except Exception as e:
-            logger.error(f"Unexpected error downloading from {url}: {e}")
+
+        try:
+            response.raise_for_status()
+        except requests.RequestException as e:
+            response.close()
+            logger.error(f"Network error downloading from {url}: {e}")
             return None
+
+        response.raw.decode_content = True
+        return response
+
+    def get_read_buffer(self) -> bytearray:
+        """Get the calling thread's reusable download buffer
+
+        Returns:
+            Buffer to pass to read_stream; grown as needed and kept
+        """
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = bytearray(READ_BUFFER_SIZE)
+        return buffer
+
+    def read_stream(
+        self,
+        response: requests.Response,
+        buffer: Optional[bytearray] = None,
+    ) -> Union[bytearray, memoryview]:
+        """Read a streaming response body into a single pre-sized buffer
+
+        Args:
+            response: Response opened with open_stream
+            buffer: Optional reusable buffer, e.g. from get_read_buffer
+
+        Returns:
+            Response body; when a buffer is given, a view of its filled
+            part that must be released before the buffer is reused
+        """
+        # Content-Length describes the body only when it is not encoded
+        expected = 0
+        if response.headers.get("Content-Encoding", "identity") == "identity":
+            expected = int(response.headers.get("Content-Length") or 0)
+
+        reused = buffer is not None
+        if not reused:
+            buffer = bytearray(expected or STREAM_CHUNK_SIZE)
+        elif len(buffer) < expected:
+            buffer.extend(bytes(expected - len(buffer)))
+        received = 0
+
+        while not expected or received < expected:
+            if received == len(buffer):
+                buffer.extend(bytes(len(buffer) or STREAM_CHUNK_SIZE))
+            with memoryview(buffer) as view:
+                count = response.raw.readinto(view[received:])
+            if not count:
+                break
+            received += count
+
+        if reused:
+            return memoryview(buffer)[:received]
+        del buffer[received:]
+        return buffer
+
+    def create_async_session(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        ttl_dns_cache: int = 300,
+    ) -> aiohttp.ClientSession:
+        """Create an aiohttp session with a keep-alive connection pool
+
+        Must be called from within a running event loop.
+
+        Args:
+            limit: Maximum number of simultaneous connections
+            limit_per_host: Maximum simultaneous connections per host
+            ttl_dns_cache: Seconds to cache resolved host names
+
+        Returns:
+            Configured aiohttp client session
+        """
+        connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=ttl_dns_cache,
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def download_async(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        headers: Optional[dict] = None,
+    ) -> Optional[bytes]:
+        """Download content asynchronously with retry logic
+
+        Mirrors the retry strategy of create_session: retryable status
+        codes and connection errors are retried with exponential backoff.
+
+        Args:
+            url: URL to download from
+            session: aiohttp session to use
+            headers: Optional extra request headers
+
+        Returns:
+            Downloaded content as bytes, or None if failed
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if (
+                        response.status in RETRY_STATUS_CODES
+                        and attempt < self.max_retries
+                    ):
+                        await asyncio.sleep(2**attempt)
+                        continue
+                    response.raise_for_status()
+                    return await response.read()
+            except aiohttp.ClientResponseError as e:
+                logger.error(f"Network error downloading from {url}: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < self.max_retries:
+                    await asyncio.sleep(2**attempt)
+                    continue
+                logger.error(f"Network error downloading from {url}: {e}")
+                return None
+            except Exception as e:
+                logger.error(f"Unexpected error downloading from {url}: {e}")
+                return None
+        return None
@@ -3,11 +3,13 @@
 Test script for CS:GO Medal Parser regex filtering functionality
 """
 
-import json
+import os
 import sys
 from pathlib import Path
 
+import orjson
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from config import COLLECTIBLE_TYPES, DUMP_FOLDER
 
@@ -18,6 +20,8 @@ from src.models.collectible import Collectible, CollectibleFilter  # noqa: E402
 from src.services.collectible_service import CollectibleService  # noqa: E402
 from src.utils.image_processor import ImageProcessor  # noqa: E402
 
+_COLLECTIBLES_ADAPTER = TypeAdapter(list[Collectible])
+
 
 def find_newest_json_file(directory: Path) -> Path | None:
     """Finds the newest JSON file in the specified directory.
@@ -28,24 +32,54 @@ def find_newest_json_file(directory: Path) -> Path | None:
     Returns:
         Path to newest JSON file or None if not found
     """
-    if not directory.exists():
-        logger.error(f"Directory {directory} does not exist")
-        return None
-
     try:
-        json_files = list(directory.glob("*.json"))
-        if not json_files:
-            return None
+        # DirEntry.stat() is served from the directory scan where possible
+        with os.scandir(directory) as entries:
+            json_files = [
+                entry
+                for entry in entries
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(".")
+            ]
 
         # Find the newest file by creation time
-        newest_file = max(json_files, key=lambda f: f.stat().st_ctime)
-        return newest_file
+        newest_file = max(
+            json_files, key=lambda e: e.stat().st_ctime, default=None
+        )
+        return Path(newest_file.path) if newest_file else None
 
+    except FileNotFoundError:
+        logger.error(f"Directory {directory} does not exist")
+        return None
     except Exception as e:
         logger.error(f"Error reading directory {directory}: {e}")
         return None
 
 
+def _parse_collectibles_per_item(raw_data: list) -> list[Collectible]:
+    """Parse collectibles one by one, skipping and logging invalid items
+
+    Args:
+        raw_data: Decoded dump contents
+
+    Returns:
+        List of Collectible objects
+    """
+    collectibles = []
+    for item_data in raw_data:
+        try:
+            collectible = Collectible(**item_data)
+            collectibles.append(collectible)
+        except Exception as e:
+            item_id = item_data.get('id', 'unknown')
+            logger.warning(
+                f"Failed to parse collectible {item_id}: {e}"
+            )
+            continue
+
+    return collectibles
+
+
 def load_collectibles_from_file(file_path: Path) -> list[Collectible]:
     """Load collectibles from JSON file and convert to Pydantic models
 
@@ -56,28 +90,27 @@ def load_collectibles_from_file(file_path: Path) -> list[Collectible]:
         List of Collectible objects
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            raw_data = json.load(f)
-
-        collectibles = []
-        for item_data in raw_data:
-            try:
-                collectible = Collectible(**item_data)
-                collectibles.append(collectible)
-            except Exception as e:
-                item_id = item_data.get('id', 'unknown')
-                logger.warning(
-                    f"Failed to parse collectible {item_id}: {e}"
-                )
-                continue
-
-        return collectibles
+        with open(file_path, "rb") as f:
+            raw_data = orjson.loads(f.read())
+
+        # Validate the whole dump in one pass; only fall back to the
+        # per-item loop when some items are invalid
+        try:
+            return _COLLECTIBLES_ADAPTER.validate_python(raw_data)
+        except ValidationError:
+            return _parse_collectibles_per_item(raw_data)
 
     except Exception as e:
         logger.error(f"Error loading collectibles from {file_path}: {e}")
         return []
 
 
+def _to_record(collectible: Collectible) -> dict:
+    """Convert a collectible to the simple filtered-results record"""
+    image = collectible.image
+    return {"id": collectible.id, "image": str(image) if image else None}
+
+
 def save_filtered_results(
     collectibles: list[Collectible], output_file: str
 ) -> bool:
@@ -92,13 +125,10 @@ def save_filtered_results(
     """
     try:
         # Convert back to simple dict format for compatibility
-        data = [
-            {"id": c.id, "image": str(c.image) if c.image else None}
-            for c in collectibles
-        ]
+        data = list(map(_to_record, collectibles))
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         return True
 